@@ -7,7 +7,7 @@ import pandas._testing as tm
 from pandas.core.arrays import IntervalArray
 
 
-@pytest.fixture(params=[IntervalArray, IntervalIndex])
+@pytest.fixture(scope="module", params=[IntervalArray, IntervalIndex])
 def constructor(request):
     """
     Fixture for testing both interval container classes.
@@ -15,37 +15,34 @@ def constructor(request):
     return request.param
 
 
-@pytest.fixture(
-    params=[
-        (Timedelta("0 days"), Timedelta("1 day")),
-        (Timestamp("2018-01-01"), Timedelta("1 day")),
-        (0, 1),
-    ],
-    ids=lambda x: type(x[0]).__name__,
-)
-def start_shift(request):
+@pytest.fixture(scope="module")
+def breaks_container(constructor):
     """
-    Fixture for generating intervals of different types from a start value
-    and a shift value that can be added to start to generate an endpoint.
+    Fixture for a simple interval container, built once per constructor.
     """
-    return request.param
+    return constructor.from_breaks(range(5))
+
+
+# pairs of (start, shift) for generating intervals of different types, where
+# shift can be added to start to generate an endpoint
+START_SHIFT = [
+    (Timedelta("0 days"), Timedelta("1 day")),
+    (Timestamp("2018-01-01"), Timedelta("1 day")),
+    (0, 1),
+]
+START_SHIFT_IDS = ["Timedelta", "Timestamp", "int"]
 
 
 class TestOverlaps:
+    @pytest.mark.parametrize("start_shift", START_SHIFT, ids=START_SHIFT_IDS)
     def test_overlaps_interval(self, constructor, start_shift, closed, other_closed):
         start, shift = start_shift
         interval = Interval(start, start + 3 * shift, other_closed)
 
         # intervals: identical, nested, spanning, partial, adjacent, disjoint
-        tuples = [
-            (start, start + 3 * shift),
-            (start + shift, start + 2 * shift),
-            (start - shift, start + 4 * shift),
-            (start + 2 * shift, start + 4 * shift),
-            (start + 3 * shift, start + 4 * shift),
-            (start + 4 * shift, start + 5 * shift),
-        ]
-        interval_container = constructor.from_tuples(tuples, closed)
+        left = start + np.array([0, 1, -1, 2, 3, 4]) * shift
+        right = start + np.array([3, 2, 4, 4, 4, 5]) * shift
+        interval_container = constructor.from_arrays(left, right, closed)
 
         adjacent = interval.closed_right and interval_container.closed_left
         expected = np.array([True, True, True, True, adjacent, False])
@@ -60,6 +57,7 @@ class TestOverlaps:
         with pytest.raises(NotImplementedError, match="^$"):
             interval_container.overlaps(other_container)
 
+    @pytest.mark.parametrize("start_shift", START_SHIFT, ids=START_SHIFT_IDS)
     def test_overlaps_na(self, constructor, start_shift):
         """NA values are marked as False"""
         start, shift = start_shift
@@ -81,8 +79,7 @@ class TestOverlaps:
         [10, True, "foo", Timedelta("1 day"), Timestamp("2018-01-01")],
         ids=lambda x: type(x).__name__,
     )
-    def test_overlaps_invalid_type(self, constructor, other):
-        interval_container = constructor.from_breaks(range(5))
+    def test_overlaps_invalid_type(self, breaks_container, other):
         msg = f"`other` must be Interval-like, got {type(other).__name__}"
         with pytest.raises(TypeError, match=msg):
-            interval_container.overlaps(other)
+            breaks_container.overlaps(other)
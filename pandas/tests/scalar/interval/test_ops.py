@@ -4,28 +4,24 @@ import pytest
 from pandas import Interval, Timedelta, Timestamp
 
 
-@pytest.fixture(
-    params=[
-        (Timedelta("0 days"), Timedelta("1 day")),
-        (Timestamp("2018-01-01"), Timedelta("1 day")),
-        (0, 1),
-    ],
-    ids=lambda x: type(x[0]).__name__,
-)
-def start_shift(request):
-    """
-    Fixture for generating intervals of types from a start value and a shift
-    value that can be added to start to generate an endpoint
-    """
-    return request.param
+# pairs of (start, shift) for generating intervals of different types, where
+# shift can be added to start to generate an endpoint
+START_SHIFT = [
+    (Timedelta("0 days"), Timedelta("1 day")),
+    (Timestamp("2018-01-01"), Timedelta("1 day")),
+    (0, 1),
+]
+START_SHIFT_IDS = ["Timedelta", "Timestamp", "int"]
 
 
 class TestOverlaps:
+    @pytest.mark.parametrize("start_shift", START_SHIFT, ids=START_SHIFT_IDS)
     def test_overlaps_self(self, start_shift, closed):
         start, shift = start_shift
         interval = Interval(start, start + shift, closed)
         assert interval.overlaps(interval)
 
+    @pytest.mark.parametrize("start_shift", START_SHIFT, ids=START_SHIFT_IDS)
     def test_overlaps_nested(self, start_shift, closed, other_closed):
         start, shift = start_shift
         interval1 = Interval(start, start + 3 * shift, other_closed)
@@ -34,6 +30,7 @@ class TestOverlaps:
         # nested intervals should always overlap
         assert interval1.overlaps(interval2)
 
+    @pytest.mark.parametrize("start_shift", START_SHIFT, ids=START_SHIFT_IDS)
     def test_overlaps_disjoint(self, start_shift, closed, other_closed):
         start, shift = start_shift
         interval1 = Interval(start, start + shift, other_closed)
@@ -42,6 +39,7 @@ class TestOverlaps:
         # disjoint intervals should never overlap
         assert not interval1.overlaps(interval2)
 
+    @pytest.mark.parametrize("start_shift", START_SHIFT, ids=START_SHIFT_IDS)
     def test_overlaps_endpoint(self, start_shift, closed, other_closed):
         start, shift = start_shift
         interval1 = Interval(start, start + shift, other_closed)